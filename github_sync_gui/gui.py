@@ -2,21 +2,48 @@
 import sys
 import os
 import json
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional, faster config load/save
+except ImportError:
+    orjson = None
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                                QHBoxLayout, QCheckBox, QLabel, QLineEdit,
-                               QTableWidget, QTableWidgetItem, QPushButton,
-                               QHeaderView, QComboBox, QFileDialog, QProgressBar,
-                               QMessageBox, QInputDialog)
-from PySide6.QtCore import Qt, QThread, Signal
-
-from sync_core import (sync, get_branches, SyncError, download_zipball,
-                       extract_zip_to_temp, calculate_changes, local_mirror)
+                               QTableView, QAbstractItemView, QPushButton,
+                               QHeaderView, QComboBox, QFileDialog, QToolTip,
+                               QMessageBox, QInputDialog, QStyle, QStyledItemDelegate,
+                               QStyleOptionViewItem, QStyleOptionButton,
+                               QStyleOptionComboBox, QStyleOptionProgressBar)
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import (Qt, QEvent, QModelIndex, QObject, QRect, QRunnable, QThread,
+                            QThreadPool, QTimer, QFileSystemWatcher, QSettings, Signal)
+
+from sync_core import (sync, get_branches, SyncError, ZipballCache,
+                       calculate_changes_from_zip, zipball_revision, local_mirror)
 
 # Fixed repository and subdirectory
 FIXED_REPO = "IGF-Ingenieure-GmbH/Revit"
 FIXED_SUB_DIR = "Skripte"
 
-# Config file stored next to the EXE (frozen) or next to the script (dev)
+# Status text is redrawn at most this often; progress only when the % changes
+STATUS_INTERVAL = 1 / 30  # seconds
+
+# Publish folders with more files + dirs than this aren't watched for changes
+# (and so never reuse a cached check result)
+MAX_WATCHED_PATHS = 2000
+
+# The branch list is the same for every row, so it is fetched once and reused
+BRANCHES_CACHE_TTL = 60.0  # seconds
+
+# Texts the branch cell shows while no real branch is selected
+_PLACEHOLDER_BRANCHES = frozenset({"Laden fehlgeschlagen", "Bitte Token eingeben", "Wird geladen...", ""})
+
+# Legacy config file next to the EXE (frozen) or next to the script (dev);
+# only read once to migrate it into QSettings
 if getattr(sys, 'frozen', False):
     APP_DIR = os.path.dirname(sys.executable)
 else:
@@ -25,36 +52,56 @@ CONFIG_FILE = os.path.join(APP_DIR, "config.json")
 
 
 # ──────────────────────────────────────────────
-# Worker Threads
+# Worker Tasks (run on the shared QThreadPool)
 # ──────────────────────────────────────────────
+# QRunnable is not a QObject and can't declare signals itself, so every
+# task carries a small QObject (``task.signals``) that emits them.
 
-class FetchBranchesThread(QThread):
-    finished = Signal(int, object, str)  # row, branches (list), preset_branch
-    error = Signal(int, str)            # row, error_msg
+class TaskSignals(QObject):
+    """Base of the signal holders; keeps a reference back to its task so
+    slots can find the task through ``self.sender().task``."""
 
-    def __init__(self, row, token, repo, preset_branch):
+    def __init__(self, task):
         super().__init__()
-        self.row = row
+        self.task = task
+
+
+class FetchBranchesSignals(TaskSignals):
+    finished = Signal(object, object)   # branches (list), {row: preset_branch}
+    error = Signal(str, object)         # error_msg, {row: preset_branch}
+
+
+class FetchBranchesTask(QRunnable):
+    def __init__(self, token, repo, presets):
+        super().__init__()
+        self.signals = FetchBranchesSignals(self)
         self.token = token
         self.repo = repo
-        self.preset_branch = preset_branch
+        self.presets = presets  # rows to fill once the list arrives
 
     def run(self):
         try:
             branches = get_branches(self.repo, self.token)
-            self.finished.emit(self.row, branches, self.preset_branch)
+            self.signals.finished.emit(branches, self.presets)
         except Exception as e:
             print(f"[FetchBranches ERROR] repo={self.repo}: {e}")
-            self.error.emit(self.row, str(e))
+            self.signals.error.emit(str(e), self.presets)
 
 
-class CheckUpdatesThread(QThread):
+class CheckUpdatesSignals(TaskSignals):
     progress = Signal(int, str)     # row, status_msg
     finished = Signal(int, int)     # row, changes_count
     error = Signal(int, str)        # row, error_msg
+    dir_checked = Signal(str, str, int)  # local_dir, zip revision, changes_count
+
 
-    def __init__(self, row, repo, branch, token, local_dirs):
+class CheckUpdatesTask(QRunnable):
+    def __init__(self, row, repo, branch, token, local_dirs, zip_cache, known=None):
         super().__init__()
+        self.signals = CheckUpdatesSignals(self)
+        self.zip_cache = zip_cache
+        # {local_dir: (revision, changes)} of unmodified dirs from earlier checks
+        self.known = known or {}
         self.row = row
         self.repo = repo
         self.branch = branch
@@ -63,51 +110,78 @@ class CheckUpdatesThread(QThread):
 
     def run(self):
         try:
-            self.progress.emit(self.row, "ZIP-Archiv wird heruntergeladen...")
+            self.signals.progress.emit(self.row, "ZIP-Archiv wird heruntergeladen...")
 
             def dl_cb(mb, done):
                 if done:
-                    self.progress.emit(self.row, f"Download abgeschlossen ({mb:.1f} MB)")
+                    self.signals.progress.emit(self.row, f"Download abgeschlossen ({mb:.1f} MB)")
                 else:
-                    self.progress.emit(self.row, f"Wird heruntergeladen... {mb:.1f} MB")
-
-            zip_bytes = download_zipball(self.repo, self.branch, self.token, dl_cb)
+                    self.signals.progress.emit(self.row, f"Wird heruntergeladen... {mb:.1f} MB")
 
-            self.progress.emit(self.row, "Wird entpackt...")
-            source_root = extract_zip_to_temp(zip_bytes, FIXED_SUB_DIR)
+            zip_path = self.zip_cache.get(self.repo, self.branch, self.token, dl_cb)
 
             try:
-                import tempfile, shutil
+                self.signals.progress.emit(self.row, "Dateien werden verglichen...")
+                revision = zipball_revision(zip_path)
+
+                def count_changes(local_dir):
+                    # Unchanged on both sides since the last check → reuse
+                    known = self.known.get(local_dir)
+                    if known and known[0] == revision:
+                        return known[1]
+                    changes, _ = calculate_changes_from_zip(zip_path, local_dir, FIXED_SUB_DIR)
+                    self.signals.dir_checked.emit(local_dir, revision, changes)
+                    return changes
+
+                # Each directory gets its own ZipFile reader, so they can be
+                # compared concurrently.  A missing directory simply counts
+                # every remote file as new.
+                dirs = [d for d in self.local_dirs if d]
                 total_changes = 0
-                for local_dir in self.local_dirs:
-                    if local_dir and os.path.isdir(local_dir):
-                        changes, _ = calculate_changes(source_root, local_dir)
-                        total_changes += changes
-                    elif local_dir:
-                        # Directory doesn't exist = everything is new
-                        from sync_core import collect_files
-                        total_changes += len(collect_files(source_root))
-                self.finished.emit(self.row, total_changes)
+                if dirs:
+                    with ThreadPoolExecutor(max_workers=min(4, len(dirs))) as ex:
+                        total_changes = sum(ex.map(count_changes, dirs))
             finally:
-                # Clean up the temp root properly (walk up to temp base)
-                import tempfile, shutil
-                tmp_root = source_root
-                tmp_base = tempfile.gettempdir()
-                while os.path.dirname(tmp_root) != tmp_base and tmp_root != tmp_base:
-                    tmp_root = os.path.dirname(tmp_root)
-                shutil.rmtree(tmp_root, ignore_errors=True)
+                # Lets the cache delete the archive once it's replaced
+                self.zip_cache.release(zip_path)
+            self.signals.finished.emit(self.row, total_changes)
         except Exception as e:
-            self.error.emit(self.row, str(e))
+            self.signals.error.emit(self.row, str(e))
+
+
+def _throttled_progress_cb(signals, row, col):
+    """Build a sync/mirror progress callback that doesn't flood the GUI
+    event loop with one progress and one status event per file."""
+    last_pct = -1
+    last_status = 0.0
 
+    def cb(state, current, total, msg):
+        nonlocal last_pct, last_status
+        if total > 0:
+            pct = int((current / total) * 100)
+            if pct != last_pct:
+                last_pct = pct
+                signals.progress.emit(row, col, pct)
+        now = time.monotonic()
+        if state != "syncing" or now - last_status >= STATUS_INTERVAL:
+            last_status = now
+            signals.status.emit(row, col, msg)
 
-class SyncTaskThread(QThread):
+    return cb
+
+
+class FolderTaskSignals(TaskSignals):
     progress = Signal(int, int, int)    # row, col, value (0-100)
     status = Signal(int, int, str)      # row, col, msg
     finished = Signal(int, int)         # row, col
     error = Signal(int, int, str)       # row, col, error_msg
 
-    def __init__(self, row, col, repo, branch, token, local_dir):
+
+class SyncTask(QRunnable):
+    def __init__(self, row, col, repo, branch, token, local_dir, zip_cache):
         super().__init__()
+        self.signals = FolderTaskSignals(self)
+        self.zip_cache = zip_cache
         self.row = row
         self.col = col  # 3 for Backup, 4 for Publish
         self.repo = repo
@@ -118,38 +192,30 @@ class SyncTaskThread(QThread):
     def run(self):
         try:
             if not self.local_dir:
-                self.finished.emit(self.row, self.col)
+                self.signals.finished.emit(self.row, self.col)
                 return
-            if not os.path.exists(self.local_dir):
-                os.makedirs(self.local_dir, exist_ok=True)
+            os.makedirs(self.local_dir, exist_ok=True)
 
             def d_cb(mb, done):
                 if done:
-                    self.status.emit(self.row, self.col, f"Download abgeschlossen ({mb:.1f} MB)")
+                    self.signals.status.emit(self.row, self.col, f"Download abgeschlossen ({mb:.1f} MB)")
                 else:
-                    self.status.emit(self.row, self.col, f"Wird heruntergeladen... {mb:.1f} MB")
-
-            def s_cb(state, current, total, msg):
-                if total > 0:
-                    pct = int((current / total) * 100)
-                    self.progress.emit(self.row, self.col, pct)
-                self.status.emit(self.row, self.col, msg)
+                    self.signals.status.emit(self.row, self.col, f"Wird heruntergeladen... {mb:.1f} MB")
 
-            sync(self.repo, self.branch, self.local_dir, self.token, FIXED_SUB_DIR, d_cb, s_cb)
-            self.finished.emit(self.row, self.col)
+            s_cb = _throttled_progress_cb(self.signals, self.row, self.col)
+            sync(self.repo, self.branch, self.local_dir, self.token, FIXED_SUB_DIR, d_cb, s_cb,
+                 zip_cache=self.zip_cache)
+            self.signals.finished.emit(self.row, self.col)
         except Exception as e:
-            self.error.emit(self.row, self.col, str(e))
+            self.signals.error.emit(self.row, self.col, str(e))
 
 
-class BackupTaskThread(QThread):
-    """Thread to mirror Publish folder → Backup folder (local-to-local)."""
-    progress = Signal(int, int, int)    # row, col, value (0-100)
-    status = Signal(int, int, str)      # row, col, msg
-    finished = Signal(int, int)         # row, col
-    error = Signal(int, int, str)       # row, col, error_msg
+class BackupTask(QRunnable):
+    """Task to mirror Publish folder → Backup folder (local-to-local)."""
 
     def __init__(self, row, col, source_dir, target_dir):
         super().__init__()
+        self.signals = FolderTaskSignals(self)
         self.row = row
         self.col = col  # 3 for Backup column
         self.source_dir = source_dir
@@ -158,75 +224,173 @@ class BackupTaskThread(QThread):
     def run(self):
         try:
             if not self.source_dir or not os.path.isdir(self.source_dir):
-                self.status.emit(self.row, self.col, "Quellordner nicht vorhanden")
-                self.finished.emit(self.row, self.col)
+                self.signals.status.emit(self.row, self.col, "Quellordner nicht vorhanden")
+                self.signals.finished.emit(self.row, self.col)
                 return
-            os.makedirs(self.target_dir, exist_ok=True)
-
-            def cb(state, current, total, msg):
-                if total > 0:
-                    pct = int((current / total) * 100)
-                    self.progress.emit(self.row, self.col, pct)
-                self.status.emit(self.row, self.col, msg)
 
+            # local_mirror creates target_dir itself
+            cb = _throttled_progress_cb(self.signals, self.row, self.col)
             local_mirror(self.source_dir, self.target_dir, cb)
-            self.finished.emit(self.row, self.col)
+            self.signals.finished.emit(self.row, self.col)
         except Exception as e:
-            self.error.emit(self.row, self.col, str(e))
+            self.signals.error.emit(self.row, self.col, str(e))
 
 
 # ──────────────────────────────────────────────
-# Custom Cell Widget for folder selection + progress
+# Table delegates for folder selection + progress and branch selection
 # ──────────────────────────────────────────────
-
-class FolderCellWidget(QWidget):
-    def __init__(self, path=""):
-        super().__init__()
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
-
-        self.btn = QPushButton("...")
-        self.btn.setToolTip("Ordner auswählen")
-        self.btn.setFixedWidth(30)
-
-        # Store the actual folder path separately from display text
-        self._folder_path = path
-
-        self.lbl = QLabel(path)
-        self.lbl.setWordWrap(True)
-        self.lbl.setAlignment(Qt.AlignCenter)
-
-        self.progress = QProgressBar()
-        self.progress.setRange(0, 100)
-        self.progress.setValue(0)
-        self.progress.setVisible(False)
-        self.progress.setFixedHeight(10)
-
-        top_h = QHBoxLayout()
-        top_h.addWidget(self.btn)
-        top_h.addWidget(self.lbl, 1)
-        top_h.setContentsMargins(0, 0, 0, 0)
-
-        layout.addLayout(top_h)
-        layout.addWidget(self.progress)
+# Cells are plain QStandardItems.  The delegates paint them and only create
+# an editor widget for the cell actually being edited, so a long table
+# doesn't carry several live widgets per row.
+
+FOLDER_PATH_ROLE = Qt.UserRole          # str: the selected folder
+FOLDER_STATUS_ROLE = Qt.UserRole + 1    # str shown instead of the path, or None
+FOLDER_PROGRESS_ROLE = Qt.UserRole + 2  # int 0-100, or None while no bar is shown
+BRANCHES_ROLE = Qt.UserRole + 3         # list[str] offered by the branch combo
+
+
+class FolderCellDelegate(QStyledItemDelegate):
+    """Paints a "..." button, the folder path (or a status text) and, once a
+    task has run in the cell, a progress bar below them."""
+
+    folder_clicked = Signal(QModelIndex)  # the "..." button was clicked
+
+    MARGIN = 2
+    BUTTON_WIDTH = 30
+    BUTTON_HEIGHT = 24
+    PROGRESS_HEIGHT = 10
+
+    def _rects(self, rect, index):
+        """Split a cell into (button, label, progress bar) rectangles."""
+        r = rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        bar = QRect()
+        if index.data(FOLDER_PROGRESS_ROLE) is not None:
+            bar = QRect(r.left(), r.bottom() - self.PROGRESS_HEIGHT + 1, r.width(), self.PROGRESS_HEIGHT)
+            r.setBottom(bar.top() - self.MARGIN - 1)
+        button_height = min(r.height(), self.BUTTON_HEIGHT)
+        button = QRect(r.left(), r.center().y() - button_height // 2, self.BUTTON_WIDTH, button_height)
+        label = r.adjusted(self.BUTTON_WIDTH + self.MARGIN, 0, 0, 0)
+        return button, label, bar
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+
+        # Background and selection, without the default text
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        button, label, bar = self._rects(option.rect, index)
+
+        btn = QStyleOptionButton()
+        btn.rect = button
+        btn.text = "..."
+        btn.state = QStyle.State_Enabled | QStyle.State_Raised
+        style.drawControl(QStyle.CE_PushButton, btn, painter, widget)
+
+        status = index.data(FOLDER_STATUS_ROLE)
+        text = status if status is not None else (index.data(FOLDER_PATH_ROLE) or "")
+        painter.save()
+        if option.state & QStyle.State_Selected:
+            painter.setPen(option.palette.highlightedText().color())
+        painter.drawText(label, Qt.AlignCenter | Qt.TextWordWrap, text)
+        painter.restore()
+
+        if bar.isValid():
+            bar_opt = QStyleOptionProgressBar()
+            bar_opt.rect = bar
+            bar_opt.minimum = 0
+            bar_opt.maximum = 100
+            bar_opt.progress = index.data(FOLDER_PROGRESS_ROLE)
+            bar_opt.state = QStyle.State_Enabled | QStyle.State_Horizontal
+            style.drawControl(QStyle.CE_ProgressBar, bar_opt, painter, widget)
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton
+                and self._rects(option.rect, index)[0].contains(event.position().toPoint())):
+            self.folder_clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip and self._rects(option.rect, index)[0].contains(event.pos()):
+            QToolTip.showText(event.globalPos(), "Ordner auswählen", view)
+            return True
+        return super().helpEvent(event, view, option, index)
+
+
+class BranchComboDelegate(QStyledItemDelegate):
+    """Draws the branch cell as a combo box and edits it with a real one,
+    filled from BRANCHES_ROLE."""
+
+    def _combo_rect(self, option):
+        rect = option.rect.adjusted(2, 0, -2, 0)
+        height = min(rect.height(), option.fontMetrics.height() + 10)
+        return QRect(rect.left(), rect.center().y() - height // 2, rect.width(), height)
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style.drawControl(QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        combo = QStyleOptionComboBox()
+        combo.rect = self._combo_rect(option)
+        combo.palette = option.palette
+        combo.currentText = index.data(Qt.DisplayRole) or ""
+        # Greyed out while the branch list is loading or failed to load
+        combo.state = QStyle.State_Enabled if index.flags() & Qt.ItemIsEditable else QStyle.State_None
+        style.drawComplexControl(QStyle.CC_ComboBox, combo, painter, widget)
+        style.drawControl(QStyle.CE_ComboBoxLabel, combo, painter, widget)
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(index.data(BRANCHES_ROLE) or [])
+        combo.activated.connect(self._on_activated)
+        return combo
+
+    def _on_activated(self):
+        # Commit as soon as a branch is picked instead of on focus loss
+        combo = self.sender()
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.DisplayRole) or "")
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.DisplayRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(self._combo_rect(option))
+
+
+@dataclass
+class RowModel:
+    """The items of one table row, kept in step with the model so reading a
+    row doesn't need index lookups."""
+    checkbox: QStandardItem
+    branch: QStandardItem
+    changes: QStandardItem
+    backup: QStandardItem
+    publish: QStandardItem
 
     @property
-    def folder_path(self) -> str:
-        return self._folder_path
-
-    @folder_path.setter
-    def folder_path(self, value: str):
-        self._folder_path = value
-        self.lbl.setText(value)
+    def checked(self) -> bool:
+        return self.checkbox.checkState() == Qt.Checked
 
-    def set_status(self, text: str):
-        """Update label without changing the stored folder_path."""
-        self.lbl.setText(text)
+    @property
+    def backup_path(self) -> str:
+        return self.backup.data(FOLDER_PATH_ROLE) or ""
 
-    def restore_label(self):
-        """Restore label to show the folder path."""
-        self.lbl.setText(self._folder_path)
+    @property
+    def publish_path(self) -> str:
+        return self.publish.data(FOLDER_PATH_ROLE) or ""
 
 
 # ──────────────────────────────────────────────
@@ -240,8 +404,32 @@ class MainWindow(QMainWindow):
         self.resize(1000, 600)
         self.setStyleSheet("QMainWindow { background-color: #87CEEB; }")
 
-        self._active_threads: list[QThread] = []  # Track running threads
-
+        self._active_tasks: set[QRunnable] = set()  # Keeps running tasks alive
+        self._pending_work = 0  # Check/sync/backup tasks still running
+        self._rows: list[RowModel] = []  # One entry per table row, same order
+
+        # Publish folders are watched so an unchanged folder doesn't have to
+        # be compared again; any change marks it dirty until the next check
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_watched_path_changed)
+        self._fs_watcher.fileChanged.connect(self._on_watched_path_changed)
+        self._dir_dirty: dict[str, bool] = defaultdict(lambda: True)
+        self._check_results: dict[str, tuple[str, int]] = {}  # dir → (revision, changes)
+        self._zip_cache = ZipballCache()  # One download per branch, shared by all rows
+        self._branches_cache: tuple[float, list[str]] | None = None  # (fetched_at, branches)
+        self._branch_presets: dict[int, str] | None = None  # Rows waiting for the running fetch
+        self._branch_fetch_token = ""  # Token the running fetch was started with
+
+        # Debounce token edits so only the last one triggers a re-fetch
+        self._token_timer = QTimer(self)
+        self._token_timer.setSingleShot(True)
+        self._token_timer.setInterval(250)
+        self._token_timer.timeout.connect(self._refetch_branches)
+
+        # All workers share one bounded pool instead of an OS thread per task
+        QThreadPool.globalInstance().setMaxThreadCount(min(8, QThread.idealThreadCount()))
+
+        self._settings = QSettings("IGF", "GithubSync")
         self.config = self._load_config()
         self._init_ui()
         self._populate_from_config()
@@ -249,8 +437,33 @@ class MainWindow(QMainWindow):
     # ── Config persistence ──
 
     def _load_config(self) -> dict:
+        settings = self._settings
+        if not settings.allKeys():
+            return self._load_legacy_config()
+
+        config = {
+            "token": settings.value("token", "", type=str),
+            "backup_enabled": settings.value("backup_enabled", True, type=bool),
+            "publish_enabled": settings.value("publish_enabled", True, type=bool),
+            "rows": []
+        }
+        for i in range(settings.beginReadArray("rows")):
+            settings.setArrayIndex(i)
+            config["rows"].append({
+                "checked": settings.value("checked", True, type=bool),
+                "branch": settings.value("branch", "", type=str),
+                "backup": settings.value("backup", "", type=str),
+                "publish": settings.value("publish", "", type=str)
+            })
+        settings.endArray()
+        return config
+
+    def _load_legacy_config(self) -> dict:
         if os.path.exists(CONFIG_FILE):
             try:
+                if orjson is not None:
+                    with open(CONFIG_FILE, "rb") as f:
+                        return orjson.loads(f.read())
                 with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                     return json.load(f)
             except Exception:
@@ -258,40 +471,29 @@ class MainWindow(QMainWindow):
         return {}
 
     def _save_config(self):
-        config = {
-            "token": self.token_input.text(),
-            "backup_enabled": self.cb_backup.isChecked(),
-            "publish_enabled": self.cb_publish.isChecked(),
-            "rows": []
-        }
-        for i in range(self.table.rowCount()):
-            checkbox = self.table.cellWidget(i, 0)
-            cb = checkbox.findChild(QCheckBox) if checkbox else None
-            is_checked = cb.isChecked() if cb else False
-
-            combo = self.table.cellWidget(i, 1)
-            branch = combo.currentText() if combo else ""
-
-            backup_w = self.table.cellWidget(i, 3)
-            backup_dir = backup_w.folder_path if backup_w else ""
-
-            pub_w = self.table.cellWidget(i, 4)
-            pub_dir = pub_w.folder_path if pub_w else ""
-
-            config["rows"].append({
-                "checked": is_checked,
-                "branch": branch,
-                "backup": backup_dir,
-                "publish": pub_dir
-            })
-        try:
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print("Failed to save config:", e)
+        settings = self._settings
+        settings.setValue("token", self.token_input.text())
+        settings.setValue("backup_enabled", self.cb_backup.isChecked())
+        settings.setValue("publish_enabled", self.cb_publish.isChecked())
+
+        # Drop stale entries when rows were deleted
+        settings.remove("rows")
+        settings.beginWriteArray("rows", len(self._rows))
+        for i, rm in enumerate(self._rows):
+            settings.setArrayIndex(i)
+            settings.setValue("checked", rm.checked)
+            settings.setValue("branch", rm.branch.text())
+            settings.setValue("backup", rm.backup_path)
+            settings.setValue("publish", rm.publish_path)
+        settings.endArray()
+
+        settings.sync()
+        if settings.status() != QSettings.NoError:
+            print("Failed to save config:", settings.status())
 
     def closeEvent(self, event):
         self._save_config()
+        self._zip_cache.clear()
         super().closeEvent(event)
 
     # ── UI setup ──
@@ -322,12 +524,22 @@ class MainWindow(QMainWindow):
         token_layout.addWidget(self.token_input)
         main_layout.addLayout(token_layout)
 
-        # DataGrid / TableWidget
-        self.table = QTableWidget(0, 5)
-        self.table.setHorizontalHeaderLabels([
+        # DataGrid / TableView
+        self.model = QStandardItemModel(0, 5, self)
+        self.model.setHorizontalHeaderLabels([
             "", "Branch", "Änderungen",
             "Sicherungsordner", "Veröffentlichungsordner"
         ])
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setDefaultSectionSize(50)
+        self._branch_delegate = BranchComboDelegate(self.table)
+        self._folder_delegate = FolderCellDelegate(self.table)
+        self._folder_delegate.folder_clicked.connect(self._select_folder)
+        self.table.setItemDelegateForColumn(1, self._branch_delegate)
+        self.table.setItemDelegateForColumn(3, self._folder_delegate)
+        self.table.setItemDelegateForColumn(4, self._folder_delegate)
+        self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.table.setColumnWidth(0, 40)
@@ -335,9 +547,9 @@ class MainWindow(QMainWindow):
         self.table.setColumnWidth(2, 150)
         self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
         self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setStyleSheet("QTableWidget { background-color: #ADD8E6; }")
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setStyleSheet("QTableView { background-color: #ADD8E6; }")
         main_layout.addWidget(self.table)
 
         # Bottom Buttons Layout
@@ -366,130 +578,162 @@ class MainWindow(QMainWindow):
         self.cb_backup.setChecked(self.config.get("backup_enabled", True))
         self.cb_publish.setChecked(self.config.get("publish_enabled", True))
 
+        presets = {}
         for row_data in self.config.get("rows", []):
-            self._add_row(
+            row = self._add_row(
                 row_data.get("branch", ""),
                 row_data.get("backup", ""),
                 row_data.get("publish", ""),
-                row_data.get("checked", True)
+                row_data.get("checked", True),
+                fetch_branches=False
             )
+            presets[row] = row_data.get("branch", "")
+
+        # One fetch fills every row's combo
+        if presets:
+            self._fetch_branches(presets)
 
     # ── Row management ──
 
-    def _add_row(self, branch, backup, publish, checked=True):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setRowHeight(row, 50)
+    def _add_row(self, branch, backup, publish, checked=True, fetch_branches=True):
+        row = self.model.rowCount()
 
         # Column 0: Checkbox
-        cb_widget = QWidget()
-        cb_layout = QHBoxLayout(cb_widget)
-        cb_layout.setContentsMargins(0, 0, 0, 0)
-        cb_layout.setAlignment(Qt.AlignCenter)
-        cb = QCheckBox()
-        cb.setChecked(checked)
-        cb_layout.addWidget(cb)
-        self.table.setCellWidget(row, 0, cb_widget)
-
-        # Column 1: Branch Combobox
-        combo = QComboBox()
-        if branch:
-            combo.addItem(branch)
-        self.table.setCellWidget(row, 1, combo)
+        item_check = QStandardItem()
+        item_check.setEditable(False)
+        item_check.setCheckable(True)
+        item_check.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+
+        # Column 1: Branch (combo delegate; editable once the list is loaded)
+        item_branch = QStandardItem(branch)
+        item_branch.setEditable(False)
 
         # Column 2: Changes count
-        item_changes = QTableWidgetItem("?")
-        item_changes.setFlags(Qt.ItemIsSelectable | Qt.ItemIsEnabled)
+        item_changes = QStandardItem("?")
+        item_changes.setEditable(False)
         item_changes.setTextAlignment(Qt.AlignCenter)
-        self.table.setItem(row, 2, item_changes)
 
-        # Column 3: Backup Folder
-        w_backup = FolderCellWidget(backup)
-        w_backup.btn.clicked.connect(lambda checked=False, w=w_backup: self._select_folder(w))
-        self.table.setCellWidget(row, 3, w_backup)
+        # Column 3/4: Backup / Publish Folder (folder delegate)
+        item_backup = self._folder_item(backup)
+        item_publish = self._folder_item(publish)
 
-        # Column 4: Publish Folder
-        w_publish = FolderCellWidget(publish)
-        w_publish.btn.clicked.connect(lambda checked=False, w=w_publish: self._select_folder(w))
-        self.table.setCellWidget(row, 4, w_publish)
+        self.model.appendRow([item_check, item_branch, item_changes, item_backup, item_publish])
+        self._rows.append(RowModel(item_check, item_branch, item_changes, item_backup, item_publish))
 
-        # Fetch branches dynamically (only if token is available)
-        token = self.token_input.text().strip()
-        if token:
-            self._fetch_branches_for_row(row, branch)
-        else:
-            combo = self.table.cellWidget(row, 1)
-            if combo:
-                combo.clear()
-                combo.addItem("Bitte Token eingeben")
-                combo.setEnabled(False)
-
-    def _select_folder(self, folder_widget: FolderCellWidget):
+        if fetch_branches:
+            self._fetch_branches({row: branch})
+        return row
+
+    @staticmethod
+    def _folder_item(path):
+        item = QStandardItem()
+        item.setEditable(False)
+        item.setData(path, FOLDER_PATH_ROLE)
+        return item
+
+    def _select_folder(self, index):
         dir_path = QFileDialog.getExistingDirectory(self, "Ordner auswählen")
         if dir_path:
-            folder_widget.folder_path = dir_path
+            self.model.setData(index, dir_path, FOLDER_PATH_ROLE)
+            self.model.setData(index, None, FOLDER_STATUS_ROLE)
 
     def _add_branch_dialog(self):
         self._add_row("", "", "")
 
     def _del_branch(self):
-        curr_row = self.table.currentRow()
+        curr_row = self.table.currentIndex().row()
         if curr_row >= 0:
-            self.table.removeRow(curr_row)
+            self.model.removeRow(curr_row)
+            del self._rows[curr_row]
 
     # ── Token change handler ──
 
     def _on_token_changed(self):
-        """Re-fetch branches for all rows when token is entered/changed."""
+        """Re-fetch branches (debounced) when token is entered/changed."""
+        self._token_timer.start()
+
+    def _refetch_branches(self):
         token = self.token_input.text().strip()
         if not token:
             return
-        for row in range(self.table.rowCount()):
-            combo = self.table.cellWidget(row, 1)
-            if combo:
-                current = combo.currentText()
-                # Re-fetch if loading failed or placeholder is shown
-                if current in ("Laden fehlgeschlagen", "Bitte Token eingeben", "Wird geladen...", ""):
-                    self._fetch_branches_for_row(row, "")
+        # A different token may see different branches
+        self._branches_cache = None
+        presets = {}
+        for row, rm in enumerate(self._rows):
+            # Re-fetch if loading failed or placeholder is shown
+            if rm.branch.text() in _PLACEHOLDER_BRANCHES:
+                presets[row] = ""
+        if presets:
+            self._fetch_branches(presets)
 
     # ── Branch fetching ──
 
-    def _fetch_branches_for_row(self, row, preset_branch=""):
+    def _fetch_branches(self, presets):
+        """Fill the branch combos of the rows in presets ({row: preset_branch})."""
         token = self.token_input.text().strip()
-        combo = self.table.cellWidget(row, 1)
-        if combo:
-            combo.clear()
-            combo.addItem("Wird geladen...")
-            combo.setEnabled(False)
-
-        thread = FetchBranchesThread(row, token, FIXED_REPO, preset_branch)
-        thread.finished.connect(self._on_branches_fetched)
-        thread.error.connect(self._on_branches_error)
-        self._active_threads.append(thread)
-        thread.finished.connect(lambda: self._remove_thread(thread))
-        thread.error.connect(lambda: self._remove_thread(thread))
-        thread.start()
-
-    def _on_branches_fetched(self, row, branches, preset_branch):
-        if row >= self.table.rowCount():
+        for row in presets:
+            item = self._rows[row].branch
+            # Only fetch dynamically if a token is available
+            item.setText("Wird geladen..." if token else "Bitte Token eingeben")
+            item.setEditable(False)
+        if not token:
+            return
+
+        if self._branches_cache and time.monotonic() - self._branches_cache[0] < BRANCHES_CACHE_TTL:
+            self._on_branches_fetched(self._branches_cache[1], presets)
+            return
+
+        # Rows added while a fetch is running just wait for its result
+        if self._branch_presets is not None:
+            self._branch_presets.update(presets)
             return
-        combo = self.table.cellWidget(row, 1)
-        if combo:
-            combo.clear()
-            combo.addItems(branches)
-            combo.setEnabled(True)
+        self._branch_presets = dict(presets)
+        self._branch_fetch_token = token
+
+        task = FetchBranchesTask(token, FIXED_REPO, self._branch_presets)
+        task.signals.finished.connect(self._on_branches_fetched)
+        task.signals.error.connect(self._on_branches_error)
+        self._active_tasks.add(task)
+        task.signals.finished.connect(self._on_task_done)
+        task.signals.error.connect(self._on_task_done)
+        QThreadPool.globalInstance().start(task)
+
+    def _end_branch_fetch(self, presets) -> bool:
+        """Mark the running fetch as done.  If the token was changed while
+        it ran, its result is dropped and the rows are fetched again."""
+        self._branch_presets = None
+        if self._branch_fetch_token == self.token_input.text().strip():
+            return True
+        self._fetch_branches({row: branch for row, branch in presets.items()
+                              if row < len(self._rows)})
+        return False
+
+    def _on_branches_fetched(self, branches, presets):
+        if presets is self._branch_presets:
+            if not self._end_branch_fetch(presets):
+                return
+            self._branches_cache = (time.monotonic(), branches)
+        for row, preset_branch in presets.items():
+            if row >= len(self._rows):
+                continue
+            item = self._rows[row].branch
+            item.setData(branches, BRANCHES_ROLE)
             if preset_branch and preset_branch in branches:
-                combo.setCurrentText(preset_branch)
+                item.setText(preset_branch)
+            else:
+                item.setText(branches[0] if branches else "")
+            item.setEditable(True)
 
-    def _on_branches_error(self, row, error):
-        if row >= self.table.rowCount():
+    def _on_branches_error(self, error, presets):
+        if presets is self._branch_presets and not self._end_branch_fetch(presets):
             return
-        print(f"[Branch ERROR] row={row}: {error}")
-        combo = self.table.cellWidget(row, 1)
-        if combo:
-            combo.clear()
-            combo.addItem("Laden fehlgeschlagen")
-            combo.setToolTip(error)
+        for row in presets:
+            if row >= len(self._rows):
+                continue
+            print(f"[Branch ERROR] row={row}: {error}")
+            item = self._rows[row].branch
+            item.setText("Laden fehlgeschlagen")
+            item.setToolTip(error)
 
     # ── Check Updates ──
 
@@ -498,54 +742,84 @@ class MainWindow(QMainWindow):
         self.btn_start.setEnabled(False)
 
         token = self.token_input.text().strip()
-        pending = 0
 
-        for row in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row, 0).findChild(QCheckBox)
-            if not cb or not cb.isChecked():
+        for row, rm in enumerate(self._rows):
+            if not rm.checked:
                 continue
 
-            combo = self.table.cellWidget(row, 1)
-            branch = combo.currentText() if combo else ""
-            if not branch or branch in ("Wird geladen...", "Laden fehlgeschlagen"):
+            branch = rm.branch.text()
+            if branch in _PLACEHOLDER_BRANCHES:
                 continue
 
-            bk_dir = self.table.cellWidget(row, 3).folder_path if self.cb_backup.isChecked() else None
-            pu_dir = self.table.cellWidget(row, 4).folder_path if self.cb_publish.isChecked() else None
+            bk_dir = rm.backup_path if self.cb_backup.isChecked() else None
+            pu_dir = rm.publish_path if self.cb_publish.isChecked() else None
 
             # Check updates only applies to publish folder vs remote
-            dirs = [pu_dir] if pu_dir else []
+            dirs = [os.path.normpath(pu_dir)] if pu_dir else []
             if not dirs:
                 continue
 
-            self.table.item(row, 2).setText("Wird geprüft...")
-            pending += 1
+            known = {}
+            for d in dirs:
+                if not self._dir_dirty[d] and d in self._check_results:
+                    known[d] = self._check_results[d]
+                elif self._watch_tree(d):
+                    # Watch before comparing so changes made meanwhile count
+                    self._dir_dirty[d] = False
 
-            th = CheckUpdatesThread(row, FIXED_REPO, branch, token, dirs)
-            th.progress.connect(self._on_check_progress)
-            th.finished.connect(self._on_check_finished)
-            th.error.connect(self._on_check_error)
-            self._active_threads.append(th)
-            th.finished.connect(lambda r, c, t=th: self._remove_thread_and_maybe_reenable(t))
-            th.error.connect(lambda r, e, t=th: self._remove_thread_and_maybe_reenable(t))
-            th.start()
+            rm.changes.setText("Wird geprüft...")
 
-        if pending == 0:
+            task = CheckUpdatesTask(row, FIXED_REPO, branch, token, dirs, self._zip_cache, known)
+            task.signals.progress.connect(self._on_check_progress)
+            task.signals.dir_checked.connect(self._on_dir_checked)
+            task.signals.finished.connect(self._on_check_finished)
+            task.signals.error.connect(self._on_check_error)
+            self._start_work_task(task)
+
+        if self._pending_work == 0:
             self.btn_check.setEnabled(True)
             self.btn_start.setEnabled(True)
 
+    def _on_dir_checked(self, local_dir, revision, changes):
+        self._check_results[local_dir] = (revision, changes)
+
+    # ── Publish folder watching ──
+
+    def _watch_tree(self, root) -> bool:
+        """Watch root and everything below it.  Returns False (and watches
+        nothing new) if it doesn't exist or is too large to watch."""
+        if not os.path.isdir(root):
+            return False
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            paths.append(dirpath)
+            paths.extend(os.path.join(dirpath, f) for f in filenames)
+            if len(paths) > MAX_WATCHED_PATHS:
+                return False
+        watched = set(self._fs_watcher.directories()) | set(self._fs_watcher.files())
+        new_paths = [p for p in paths if p not in watched]
+        if new_paths:
+            self._fs_watcher.addPaths(new_paths)
+        return True
+
+    def _on_watched_path_changed(self, path):
+        path = os.path.normpath(path)
+        for root in self._dir_dirty:
+            if path == root or path.startswith(root + os.sep):
+                self._dir_dirty[root] = True
+
     def _on_check_progress(self, row, msg):
-        if row < self.table.rowCount():
-            self.table.item(row, 2).setText(msg)
+        if row < len(self._rows):
+            self._rows[row].changes.setText(msg)
 
     def _on_check_finished(self, row, changes):
-        if row < self.table.rowCount():
-            self.table.item(row, 2).setText(f"{changes} Dateien zu aktualisieren" if changes > 0 else "Aktuell ✅")
+        if row < len(self._rows):
+            self._rows[row].changes.setText(f"{changes} Dateien zu aktualisieren" if changes > 0 else "Aktuell ✅")
 
     def _on_check_error(self, row, err):
-        if row < self.table.rowCount():
-            self.table.item(row, 2).setText("Fehlgeschlagen ❌")
-            self.table.item(row, 2).setToolTip(err)
+        if row < len(self._rows):
+            self._rows[row].changes.setText("Fehlgeschlagen ❌")
+            self._rows[row].changes.setToolTip(err)
 
     # ── Start Updates ──
 
@@ -553,108 +827,104 @@ class MainWindow(QMainWindow):
         self.btn_check.setEnabled(False)
         self.btn_start.setEnabled(False)
         token = self.token_input.text().strip()
-        pending = 0
 
-        for row in range(self.table.rowCount()):
-            cb = self.table.cellWidget(row, 0).findChild(QCheckBox)
-            if not cb or not cb.isChecked():
+        for row, rm in enumerate(self._rows):
+            if not rm.checked:
                 continue
 
-            combo = self.table.cellWidget(row, 1)
-            branch = combo.currentText() if combo else ""
-            if not branch or branch in ("Wird geladen...", "Laden fehlgeschlagen", "Bitte Token eingeben"):
+            branch = rm.branch.text()
+            if branch in _PLACEHOLDER_BRANCHES:
                 continue
 
-            bk_dir = self.table.cellWidget(row, 3).folder_path
-            pu_dir = self.table.cellWidget(row, 4).folder_path
+            bk_dir = rm.backup_path
+            pu_dir = rm.publish_path
 
             # Step 1: If Sicherung enabled, backup Publish → Sicherung
             if self.cb_backup.isChecked() and bk_dir and pu_dir:
                 self._run_backup(row, 3, pu_dir, bk_dir)
-                pending += 1
 
             # Step 2: If Veröffentlichung enabled, sync Remote → Publish
             if self.cb_publish.isChecked() and pu_dir:
                 self._run_sync(row, 4, FIXED_REPO, branch, token, pu_dir)
-                pending += 1
 
-        if pending == 0:
+        if self._pending_work == 0:
             self.btn_check.setEnabled(True)
             self.btn_start.setEnabled(True)
 
+    def _folder_cell(self, row, col):
+        return self.model.item(row, col) if row < self.model.rowCount() else None
+
     def _run_backup(self, row, col, source_dir, target_dir):
-        w = self.table.cellWidget(row, col)
-        if not w:
+        item = self._folder_cell(row, col)
+        if not item:
             return
-        w.progress.setVisible(True)
-        w.progress.setValue(0)
-        w.set_status("Sicherung wird erstellt...")
-
-        th = BackupTaskThread(row, col, source_dir, target_dir)
-        th.progress.connect(self._on_sync_progress)
-        th.status.connect(self._on_sync_status)
-        th.finished.connect(self._on_sync_finished)
-        th.error.connect(self._on_sync_error)
-        self._active_threads.append(th)
-        th.finished.connect(lambda r, c, t=th: self._remove_thread_and_maybe_reenable(t))
-        th.error.connect(lambda r, c, e, t=th: self._remove_thread_and_maybe_reenable(t))
-        th.start()
+        item.setData(0, FOLDER_PROGRESS_ROLE)
+        item.setData("Sicherung wird erstellt...", FOLDER_STATUS_ROLE)
+
+        task = BackupTask(row, col, source_dir, target_dir)
+        task.signals.progress.connect(self._on_sync_progress)
+        task.signals.status.connect(self._on_sync_status)
+        task.signals.finished.connect(self._on_sync_finished)
+        task.signals.error.connect(self._on_sync_error)
+        self._start_work_task(task)
 
     def _run_sync(self, row, col, repo, branch, token, local_dir):
-        w = self.table.cellWidget(row, col)
-        if not w:
+        item = self._folder_cell(row, col)
+        if not item:
             return
-        w.progress.setVisible(True)
-        w.progress.setValue(0)
-        w.set_status("Wird vorbereitet...")
-
-        th = SyncTaskThread(row, col, repo, branch, token, local_dir)
-        th.progress.connect(self._on_sync_progress)
-        th.status.connect(self._on_sync_status)
-        th.finished.connect(self._on_sync_finished)
-        th.error.connect(self._on_sync_error)
-        self._active_threads.append(th)
-        th.finished.connect(lambda r, c, t=th: self._remove_thread_and_maybe_reenable(t))
-        th.error.connect(lambda r, c, e, t=th: self._remove_thread_and_maybe_reenable(t))
-        th.start()
+        item.setData(0, FOLDER_PROGRESS_ROLE)
+        item.setData("Wird vorbereitet...", FOLDER_STATUS_ROLE)
+
+        task = SyncTask(row, col, repo, branch, token, local_dir, self._zip_cache)
+        task.signals.progress.connect(self._on_sync_progress)
+        task.signals.status.connect(self._on_sync_status)
+        task.signals.finished.connect(self._on_sync_finished)
+        task.signals.error.connect(self._on_sync_error)
+        self._start_work_task(task)
 
     def _on_sync_progress(self, row, col, val):
-        w = self.table.cellWidget(row, col)
-        if w:
-            w.progress.setValue(val)
+        item = self._folder_cell(row, col)
+        if item and item.data(FOLDER_PROGRESS_ROLE) is not None:
+            item.setData(val, FOLDER_PROGRESS_ROLE)
 
     def _on_sync_status(self, row, col, msg):
-        w = self.table.cellWidget(row, col)
-        if w:
-            w.set_status(msg)
+        item = self._folder_cell(row, col)
+        if item:
+            item.setData(msg, FOLDER_STATUS_ROLE)
 
     def _on_sync_finished(self, row, col):
-        w = self.table.cellWidget(row, col)
-        if w:
-            w.progress.setValue(100)
-            w.set_status("Synchronisierung abgeschlossen ✅")
+        item = self._folder_cell(row, col)
+        if item:
+            if item.data(FOLDER_PROGRESS_ROLE) is not None:
+                item.setData(100, FOLDER_PROGRESS_ROLE)
+            item.setData("Synchronisierung abgeschlossen ✅", FOLDER_STATUS_ROLE)
 
     def _on_sync_error(self, row, col, err):
-        w = self.table.cellWidget(row, col)
-        if w:
-            w.progress.setValue(0)
-            w.set_status(f"Fehler: {err}")
+        item = self._folder_cell(row, col)
+        if item:
+            if item.data(FOLDER_PROGRESS_ROLE) is not None:
+                item.setData(0, FOLDER_PROGRESS_ROLE)
+            item.setData(f"Fehler: {err}", FOLDER_STATUS_ROLE)
             QMessageBox.warning(self, "Synchronisierungsfehler", f"Zeile {row + 1}: Ein Fehler ist aufgetreten:\n{err}")
 
-    # ── Thread lifecycle helpers ──
+    # ── Task lifecycle helpers ──
+
+    def _start_work_task(self, task):
+        """Start a check/sync/backup task; the buttons stay disabled until
+        every such task has reported back."""
+        self._active_tasks.add(task)
+        self._pending_work += 1
+        task.signals.finished.connect(self._on_work_task_done)
+        task.signals.error.connect(self._on_work_task_done)
+        QThreadPool.globalInstance().start(task)
 
-    def _remove_thread(self, thread):
-        if thread in self._active_threads:
-            self._active_threads.remove(thread)
+    def _on_task_done(self, *_):
+        self._active_tasks.discard(self.sender().task)
 
-    def _remove_thread_and_maybe_reenable(self, thread):
-        self._remove_thread(thread)
-        # Re-enable buttons when no more active work threads remain
-        has_work = any(
-            isinstance(t, (CheckUpdatesThread, SyncTaskThread))
-            for t in self._active_threads
-        )
-        if not has_work:
+    def _on_work_task_done(self, *_):
+        self._active_tasks.discard(self.sender().task)
+        self._pending_work -= 1
+        if self._pending_work == 0:
             self.btn_check.setEnabled(True)
             self.btn_start.setEnabled(True)
 
@@ -1,26 +1,85 @@
 # sync_core.py
+import hashlib
 import io
+import json
+import ntpath
 import os
 import shutil
+import stat
 import tempfile
+import threading
+import time
 import zipfile
 import requests
 import urllib3
-from typing import Callable, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Callable, Any
 
 # Suppress SSL warnings for corporate environments with custom CA certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 API_BASE = "https://api.github.com"
+COMPARE_CHUNK_SIZE = 64 * 1024
+# Only this much of the start of a file decides whether it is binary
+BINARY_SNIFF_SIZE = 8192
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Files are compared on this many threads; the reads release the GIL
+COMPARE_WORKERS = 8
+# Changed files are written on this many threads
+APPLY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Download progress is reported at most this often (plus once when done)
+DOWNLOAD_PROGRESS_INTERVAL = 0.1  # seconds
+# Zipballs at least this big are fetched as parallel byte ranges when the
+# server supports it
+PARALLEL_DOWNLOAD_PARTS = 8
+PARALLEL_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+# Uncached downloads stay in memory up to this size, then move to a temp file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
+# Base directory the gs_ temp files are created in
+_TMP_BASE = tempfile.gettempdir()
+
+# Per-folder manifests (see _load_manifest) are kept outside the synced
+# folders, so they are neither synced, backed up nor seen by folder watchers
+if os.name == "nt":
+    MANIFEST_DIR = os.path.join(os.environ.get("LOCALAPPDATA") or _TMP_BASE, "GithubSync", "manifests")
+else:
+    MANIFEST_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                                "github_sync", "manifests")
+
+# Relative paths are "/"-separated throughout; _to_os converts one for the
+# file system, and is chosen once here so POSIX skips the per-file replace
+if os.sep == "/":
+    def _to_os(rel_path: str) -> str:
+        return rel_path
+else:
+    def _to_os(rel_path: str) -> str:
+        return rel_path.replace("/", os.sep)
 
 class SyncError(Exception):
     pass
 
+def _new_session() -> requests.Session:
+    session = requests.Session()
+    session.headers["Accept"] = "application/vnd.github+json"
+    # Transient failures are retried with backoff; the final response is
+    # returned rather than raised so _check_response can report it
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# Shared by all requests (and threads) so TCP/TLS connections are reused
+_SESSION = _new_session()
+
 def _headers(token: str | None) -> dict:
-    h = {"Accept": "application/vnd.github+json"}
-    if token:
-        h["Authorization"] = f"Bearer {token}"
-    return h
+    """Per-request headers; Accept is set on _SESSION."""
+    return {"Authorization": f"Bearer {token}"} if token else {}
 
 def _check_response(resp: requests.Response, context: str):
     if resp.status_code == 401:
@@ -40,7 +99,7 @@ def get_branches(repo: str, token: str | None) -> list[str]:
     url = f"{API_BASE}/repos/{repo}/branches?per_page=100"
     try:
         while url:
-            resp = requests.get(url, headers=_headers(token), timeout=30, verify=False)
+            resp = _SESSION.get(url, headers=_headers(token), timeout=30, verify=False)
             _check_response(resp, f"Branches für Repository '{repo}' konnten nicht abgerufen werden")
             branches.extend(b["name"] for b in resp.json())
             # Follow pagination via Link header
@@ -59,185 +118,827 @@ def get_latest_commit_sha(repo: str, branch: str, token: str | None) -> str:
     """Fetch the latest commit SHA for a branch."""
     url = f"{API_BASE}/repos/{repo}/commits/{branch}"
     try:
-        resp = requests.get(url, headers=_headers(token), timeout=30, verify=False)
+        resp = _SESSION.get(url, headers=_headers(token), timeout=30, verify=False)
         _check_response(resp, f"Commit-Verlauf für Repository '{repo}' konnte nicht abgerufen werden")
         return resp.json()["sha"]
     except requests.RequestException as e:
          raise SyncError(f"Netzwerkfehler: {e}")
 
-def download_zipball(repo: str, branch: str, token: str | None, progress_cb: Callable[[float, bool], None] | None) -> bytes:
-    """Download the branch as a ZIP archive and return raw bytes."""
+def _fetch_zipball(repo: str, branch: str, token: str | None,
+                   progress_cb: Callable[[float, bool], None] | None,
+                   out: BinaryIO, etag: str | None = None) -> tuple[bool, str | None]:
+    """Download the branch as a ZIP archive into out.
+
+    Returns (modified, ETag).  When etag is given and the archive has not
+    changed, the server answers 304, nothing is written and (False, etag)
+    is returned.
+    """
     url = f"{API_BASE}/repos/{repo}/zipball/{branch}"
-    resp = requests.get(url, headers=_headers(token), timeout=600, stream=True, verify=False)
+    headers = _headers(token)
+    if etag:
+        headers["If-None-Match"] = etag
+    resp = _SESSION.get(url, headers=headers, timeout=600, stream=True, verify=False)
+    if resp.status_code == 304:
+        resp.close()
+        return False, etag
     _check_response(resp, f"Branch '{branch}' existiert nicht im Repository '{repo}'")
 
-    chunks = []
     downloaded = 0
+    last_report = 0.0
     # Estimate size? It's not provided by zipball header typically, so we just track downloaded MB
-    for chunk in resp.iter_content(chunk_size=1024 * 256):
-        chunks.append(chunk)
+    for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        out.write(chunk)
         downloaded += len(chunk)
-        mb = downloaded / (1024 * 1024)
-        if progress_cb:
-            progress_cb(mb, False)
+        if progress_cb and time.monotonic() - last_report >= DOWNLOAD_PROGRESS_INTERVAL:
+            last_report = time.monotonic()
+            progress_cb(downloaded / (1024 * 1024), False)
 
     if progress_cb:
         progress_cb(downloaded / (1024 * 1024), True)
-    return b"".join(chunks)
+    return True, resp.headers.get("ETag")
 
-def extract_zip_to_temp(zip_bytes: bytes, sub_dir: str | None) -> str:
-    tmp_dir = tempfile.mkdtemp(prefix="gs_")
+class _RangeNotServed(Exception):
+    """The server answered a range request with something other than that range."""
 
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
-        zf.extractall(tmp_dir)
+def download_zipball_parallel(repo: str, branch: str, token: str | None, path: str,
+                              progress_cb: Callable[[float, bool], None] | None = None,
+                              etag: str | None = None,
+                              parts: int = PARALLEL_DOWNLOAD_PARTS) -> tuple[bool, str | None]:
+    """Download the branch as a ZIP archive into the file at path, using
+    several concurrent range requests when the server allows it.
 
-    entries = os.listdir(tmp_dir)
-    if len(entries) == 1 and os.path.isdir(os.path.join(tmp_dir, entries[0])):
-        long_name = os.path.join(tmp_dir, entries[0])
-        # Rename the long GitHub folder name (e.g. "Owner-Repo-sha") to "r"
-        # to avoid Windows MAX_PATH (260 char) issues
-        short_name = os.path.join(tmp_dir, "r")
+    Falls back to a single stream (see _fetch_zipball) unless a HEAD request
+    reports the size, range support and an ETag.  Returns (modified, ETag)
+    like _fetch_zipball.
+    """
+    url = f"{API_BASE}/repos/{repo}/zipball/{branch}"
+    headers = _headers(token)
+    if etag:
+        headers["If-None-Match"] = etag
+    head = _SESSION.head(url, headers=headers, timeout=30, allow_redirects=True, verify=False)
+    if head.status_code == 304:
+        return False, etag
+
+    size = int(head.headers.get("Content-Length") or 0)
+    new_etag = head.headers.get("ETag")
+    if (not head.ok or head.headers.get("Accept-Ranges") != "bytes"
+            or size < PARALLEL_DOWNLOAD_MIN_SIZE or not new_etag):
+        with open(path, "wb") as f:
+            return _fetch_zipball(repo, branch, token, progress_cb, f, etag)
+
+    # Talk to the final (redirected) URL directly; like requests' own
+    # redirect handling, don't send the token to another host
+    part_headers = {} if head.history else _headers(token)
+    # If-Range: should the archive change mid-download, the server sends
+    # the whole new file instead of a range and we start over below
+    part_headers["If-Range"] = new_etag
+
+    lock = threading.Lock()
+    downloaded = 0
+    last_report = 0.0
+    # Set when a part fails, so the others stop instead of finishing
+    # downloads that get thrown away
+    abort = threading.Event()
+
+    def fetch_part(start, end):
         try:
-            os.rename(long_name, short_name)
-            content_root = short_name
+            _fetch_part(start, end)
+        except BaseException:
+            abort.set()
+            raise
+
+    def _fetch_part(start, end):
+        nonlocal downloaded, last_report
+        if abort.is_set():
+            return
+        with _SESSION.get(head.url, headers={**part_headers, "Range": f"bytes={start}-{end}"},
+                          timeout=600, stream=True, verify=False) as resp:
+            if (resp.status_code != 206
+                    or not resp.headers.get("Content-Range", "").startswith(f"bytes {start}-{end}/")):
+                raise _RangeNotServed()
+            with open(path, "r+b") as f:
+                f.seek(start)
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if abort.is_set():
+                        return
+                    f.write(chunk)
+                    with lock:
+                        downloaded += len(chunk)
+                        mb = downloaded / (1024 * 1024)
+                        report = time.monotonic() - last_report >= DOWNLOAD_PROGRESS_INTERVAL
+                        if report:
+                            last_report = time.monotonic()
+                    if progress_cb and report:
+                        progress_cb(mb, False)
+                if f.tell() != end + 1:
+                    raise SyncError(f"Download unvollständig: Branch '{branch}' im Repository '{repo}'")
+
+    with open(path, "wb") as f:
+        f.truncate(size)
+    part_size = -(-size // parts)
+    try:
+        with ThreadPoolExecutor(max_workers=parts, thread_name_prefix="zipball") as ex:
+            futures = [ex.submit(fetch_part, start, min(start + part_size, size) - 1)
+                       for start in range(0, size, part_size)]
+            for fut in futures:
+                fut.result()
+    except _RangeNotServed:
+        # The download starts over, so its progress does too
+        if progress_cb:
+            progress_cb(0.0, False)
+        with open(path, "wb") as f:
+            return _fetch_zipball(repo, branch, token, progress_cb, f, etag)
+
+    if progress_cb:
+        progress_cb(size / (1024 * 1024), True)
+    return True, new_etag
+
+class _SpooledDownload:
+    """Write target that keeps a download in memory up to max_size bytes
+    and moves it to a temp file beyond that.
+
+    Unlike tempfile.SpooledTemporaryFile the file has a path, so every
+    _ZipReaders thread can open it on its own.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._buf: io.BytesIO | None = io.BytesIO()
+        self._file: BinaryIO | None = None
+        self._path: str | None = None
+
+    def write(self, data: bytes) -> int:
+        if self._file is None and self._buf.tell() + len(data) > self.max_size:
+            fd, self._path = tempfile.mkstemp(prefix="gs_", suffix=".zip", dir=_TMP_BASE)
+            self._file = os.fdopen(fd, "wb")
+            self._file.write(self._buf.getbuffer())
+            self._buf = None
+        return (self._file or self._buf).write(data)
+
+    def result(self) -> bytes | str:
+        """Return the downloaded bytes, or the path of the temp file
+        holding them (which the caller then removes)."""
+        if self._file is None:
+            # getvalue() hands over the BytesIO's own buffer (trimmed in
+            # place) rather than joining or copying it
+            data, self._buf = self._buf.getvalue(), None
+            return data
+        self._file.close()
+        return self._path
+
+    def discard(self):
+        if self._file is not None:
+            self._file.close()
+            os.remove(self._path)
+
+def _download_spooled(repo: str, branch: str, token: str | None,
+                      progress_cb: Callable[[float, bool], None] | None) -> bytes | str:
+    """Download the branch as a ZIP archive for one-off use: small archives
+    are returned as bytes without touching the disk, larger ones as the path
+    of a temp file the caller has to remove."""
+    out = _SpooledDownload(SPOOL_MAX_SIZE)
+    try:
+        _fetch_zipball(repo, branch, token, progress_cb, out)
+    except BaseException:
+        out.discard()
+        raise
+    return out.result()
+
+def _open_zip(zip_data: bytes | str) -> zipfile.ZipFile:
+    """Open a zipball given as raw bytes or as the path of a file holding it."""
+    if isinstance(zip_data, bytes):
+        return zipfile.ZipFile(io.BytesIO(zip_data))
+    return zipfile.ZipFile(zip_data)
+
+class ZipballCache:
+    """Shares downloaded zipballs between tasks working on the same branch.
+
+    Keeps the last ``max_entries`` branches, each in a temp file so cached
+    archives don't sit in memory; ``get`` returns the file's path, which
+    stays on disk until the caller hands it back with ``release`` (even if
+    the entry is replaced or evicted meanwhile).  Concurrent lookups of
+    the same branch wait for each other and reuse whatever the first one
+    fetched; later lookups revalidate the stored copy with its ETag
+    (304 → no body).
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[str | None, str, float]] = OrderedDict()
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._stale: list[str] = []  # Replaced files that were still in use
+        self._leases: dict[str, int] = {}  # Path → number of callers using it
+
+    def get(self, repo: str, branch: str, token: str | None,
+            progress_cb: Callable[[float, bool], None] | None = None) -> str:
+        key = (repo, branch)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        requested = time.monotonic()
+        downloaded = False
+        with key_lock:
+            with self._lock:
+                cached = self._entries.get(key)
+                if cached:
+                    # Leased right away, so other branches evicting it while
+                    # this one revalidates can't delete the file
+                    self._lease(cached[1])
+            if cached and cached[2] >= requested:
+                # Fetched by another task while this one was waiting
+                zip_path = cached[1]
+            else:
+                try:
+                    zip_path, etag, downloaded = self._download(
+                        repo, branch, token, progress_cb, cached[0] if cached else None)
+                except BaseException:
+                    if cached:
+                        self.release(cached[1])
+                    raise
+                with self._lock:
+                    if downloaded:
+                        self._lease(zip_path)
+                        if cached:
+                            self._unlease(cached[1])
+                    else:
+                        zip_path = cached[1]
+                        # Evicted during the revalidation, but current again
+                        if zip_path in self._stale:
+                            self._stale.remove(zip_path)
+                    self._entries[key] = (etag, zip_path, time.monotonic())
+                    self._entries.move_to_end(key)
+                    if cached and cached[1] != zip_path:
+                        self._stale.append(cached[1])
+                    while len(self._entries) > self.max_entries:
+                        self._stale.append(self._entries.popitem(last=False)[1][1])
+                    self._remove_stale()
+
+        # A fresh download has already reported completion itself
+        if progress_cb and not downloaded:
+            progress_cb(os.path.getsize(zip_path) / (1024 * 1024), True)
+        return zip_path
+
+    def _download(self, repo, branch, token, progress_cb, etag):
+        fd, path = tempfile.mkstemp(prefix="gs_", suffix=".zip", dir=_TMP_BASE)
+        os.close(fd)
+        try:
+            modified, etag = download_zipball_parallel(repo, branch, token, path, progress_cb, etag)
+        except BaseException:
+            os.remove(path)
+            raise
+        if not modified:
+            os.remove(path)
+        return path, etag, modified
+
+    def release(self, zip_path: str):
+        """Hand back a path returned by get; the file may be deleted once
+        no caller holds it and it is no longer cached."""
+        with self._lock:
+            self._unlease(zip_path)
+            self._remove_stale()
+
+    def _lease(self, zip_path: str):
+        self._leases[zip_path] = self._leases.get(zip_path, 0) + 1
+
+    def _unlease(self, zip_path: str):
+        count = self._leases.get(zip_path, 0) - 1
+        if count > 0:
+            self._leases[zip_path] = count
+        else:
+            self._leases.pop(zip_path, None)
+
+    def _remove_stale(self):
+        # Files still leased are kept until released; on Windows a file
+        # that is still open somewhere can't be deleted yet either, so
+        # it is retried on the next change and on clear()
+        still_used = []
+        for path in self._stale:
+            if path in self._leases:
+                still_used.append(path)
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                still_used.append(path)
+        self._stale = still_used
+
+    def clear(self):
+        with self._lock:
+            self._stale.extend(entry[1] for entry in self._entries.values())
+            self._entries.clear()
+            self._remove_stale()
+
+# Characters Windows doesn't allow in file names; extractall maps them to "_"
+_WINDOWS_ILLEGAL = str.maketrans(':<>|"?*', "_" * 7)
+
+def _member_path(rel: str) -> str | None:
+    """Return the relative path a member is written to, or None if it would
+    land outside the target folder.
+
+    Members are written directly instead of through extractall, so its
+    sanitising has to be done here.  Traversal (backslashes, drive letters
+    included) is refused on every platform; on Windows, illegal characters
+    become "_" and trailing dots and spaces are dropped from each part, like
+    ZipFile._sanitize_windows_name does (else "a:b" would write an
+    alternate data stream of "a").
+    """
+    if rel.startswith(("/", "\\")) or ntpath.splitdrive(rel)[0]:
+        return None
+    parts = rel.replace("\\", "/").split("/")
+    if ".." in parts:
+        return None
+    if os.name != "nt":
+        return rel
+    parts = (part.translate(_WINDOWS_ILLEGAL).rstrip(". ") for part in parts)
+    return "/".join(part for part in parts if part) or None
+
+def _zip_members(zf: zipfile.ZipFile, sub_dir: str | None) -> dict[str, zipfile.ZipInfo]:
+    """Map paths relative to sub_dir to the ZIP members that hold them."""
+    prefix = sub_dir.strip("/") + "/" if sub_dir else ""
+    found_sub_dir = not prefix
+    members: dict[str, zipfile.ZipInfo] = {}
+    for info in zf.infolist():
+        # Drop the long GitHub folder name (e.g. "Owner-Repo-sha/")
+        _, _, rel = info.filename.partition("/")
+        if prefix:
+            if not rel.startswith(prefix):
+                continue
+            found_sub_dir = True
+            rel = rel[len(prefix):]
+        if rel and not info.is_dir():
+            rel = _member_path(rel)
+            if rel:
+                members[rel] = info
+    if not found_sub_dir:
+        raise SyncError(f"Unterverzeichnis '{sub_dir}' existiert nicht im Remote-Repository.")
+    return members
+
+class _ZipReaders:
+    """Gives every thread its own ZipFile on the same archive.
+
+    ZipFile's bookkeeping for members opened at the same time isn't
+    thread-safe, so worker threads must not share one instance.
+    """
+
+    def __init__(self, zip_data: bytes | str):
+        self._zip_data = zip_data
+        self._local = threading.local()
+        self._opened: list[zipfile.ZipFile] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> zipfile.ZipFile:
+        zf = getattr(self._local, "zf", None)
+        if zf is None:
+            zf = self._local.zf = _open_zip(self._zip_data)
+            with self._lock:
+                self._opened.append(zf)
+        return zf
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        for zf in self._opened:
+            zf.close()
+
+def zipball_revision(zip_data: bytes | str) -> str:
+    """Return the top-level folder name of a GitHub zipball
+    ("Owner-Repo-<sha>"), which identifies the commit it was built from."""
+    with _open_zip(zip_data) as zf:
+        names = zf.namelist()
+    return names[0].partition("/")[0] if names else ""
+
+def collect_files(root: str) -> dict[str, str]:
+    """Map the relative path ("/"-separated) of every file below root to
+    its absolute path."""
+    # Kept in pure Python on purpose: scandir classifies entries from the
+    # directory listing itself (no stat per file), which leaves little for
+    # a compiled walker to win, and the GUI ships without a build step
+    paths: dict[str, str] = {}
+    stack = [(root, "")]
+    while stack:
+        dirpath, prefix = stack.pop()
+        try:
+            it = os.scandir(dirpath)
         except OSError:
-            content_root = long_name
-    else:
-        content_root = tmp_dir
-
-    if sub_dir:
-        sub_path = os.path.join(content_root, sub_dir.replace("/", os.sep))
-        if not os.path.isdir(sub_path):
-            shutil.rmtree(tmp_dir, ignore_errors=True)
-            raise SyncError(f"Unterverzeichnis '{sub_dir}' existiert nicht im Remote-Repository.")
-        content_root = sub_path
-
-    return content_root
-
-def collect_files(root: str) -> set[str]:
-    paths: set[str] = set()
-    for dirpath, _, filenames in os.walk(root):
-        for fname in filenames:
-            abs_path = os.path.join(dirpath, fname)
-            rel = os.path.relpath(abs_path, root).replace(os.sep, "/")
-            paths.add(rel)
+            continue
+        with it:
+            for entry in it:
+                # Same as os.walk: symlinked dirs are neither files nor entered
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append((entry.path, prefix + entry.name + "/"))
+                else:
+                    paths[prefix + entry.name] = entry.path
     return paths
 
-def _is_binary(data: bytes) -> bool:
-    return b"\x00" in data[:8192]
+def _is_binary(data: bytes | bytearray) -> bool:
+    """Classify a file as binary by a NUL byte in its first
+    BINARY_SNIFF_SIZE bytes; data is (at least) the start of the file."""
+    # find() with bounds scans in place instead of copying a slice, and
+    # works the same on mmap objects
+    return data.find(b"\x00", 0, BINARY_SNIFF_SIZE) != -1
 
 def files_identical(path_a: str, path_b: str) -> bool:
     try:
-        with open(path_a, "rb") as fa:
-            data_a = fa.read()
-        with open(path_b, "rb") as fb:
-            data_b = fb.read()
+        with open(path_a, "rb") as fa, open(path_b, "rb") as fb:
+            return _streams_identical(fa, fb, os.fstat(fa.fileno()).st_size,
+                                      os.fstat(fb.fileno()).st_size)
     except (OSError, PermissionError):
         return False
 
-    if data_a == data_b:
-        return True
+def _normalized_chunks(f):
+    """Yield the rest of f chunk by chunk with CRLF normalized to LF."""
+    carry = b""
+    while chunk := f.read(COMPARE_CHUNK_SIZE):
+        chunk = carry + chunk
+        # Hold back a trailing CR in case its LF starts the next chunk
+        if chunk.endswith(b"\r"):
+            chunk, carry = chunk[:-1], b"\r"
+        else:
+            carry = b""
+        yield chunk.replace(b"\r\n", b"\n")
+    if carry:
+        yield carry
+
+def _chunks_equal(chunks_a, chunks_b) -> bool:
+    """Compare two chunk iterables whose chunk boundaries may differ."""
+    buf_a = buf_b = b""
+    pos_a = pos_b = 0
+    while True:
+        while pos_a == len(buf_a):
+            buf_a, pos_a = next(chunks_a, None), 0
+            if buf_a is None:
+                break
+        while pos_b == len(buf_b):
+            buf_b, pos_b = next(chunks_b, None), 0
+            if buf_b is None:
+                break
+        if buf_a is None or buf_b is None:
+            return buf_a is None and buf_b is None
+        n = min(len(buf_a) - pos_a, len(buf_b) - pos_b)
+        # Compare in place; slicing off the compared part would copy the
+        # rest of both buffers every time
+        if not buf_a.startswith(memoryview(buf_b)[pos_b:pos_b + n], pos_a):
+            return False
+        pos_a += n
+        pos_b += n
+
+def _streams_identical(fa, fb, size_a: int | None = None, size_b: int | None = None) -> bool:
+    """Streaming counterpart of files_identical for two seekable binary streams.
+
+    Known sizes let obviously different files be rejected early.
+    """
+    if size_a is not None and size_b is not None:
+        # CRLF → LF normalization at most halves a file, so sizes further
+        # apart than that can never compare equal
+        if max(size_a, size_b) > 2 * min(size_a, size_b):
+            return False
+
+    first_a = a = fa.read(COMPARE_CHUNK_SIZE)
+    first_b = b = fb.read(COMPARE_CHUNK_SIZE)
+    # Different sizes can't be an exact match; go straight to the text check
+    if size_a == size_b:
+        while a == b:
+            if not a:
+                return True
+            a = fa.read(COMPARE_CHUNK_SIZE)
+            b = fb.read(COMPARE_CHUNK_SIZE)
+
+    if _is_binary(first_a) or _is_binary(first_b):
+        return False
 
-    if not _is_binary(data_a) and not _is_binary(data_b):
-        return data_a.replace(b"\r\n", b"\n") == data_b.replace(b"\r\n", b"\n")
+    fa.seek(0)
+    fb.seek(0)
+    return _chunks_equal(_normalized_chunks(fa), _normalized_chunks(fb))
 
-    return False
+def _copy_file(src: str, dst: str):
+    """Copy the data (sendfile where available) and timestamps of src to dst.
 
-def remove_empty_dirs(root: str):
-    for dirpath, _, _ in os.walk(root, topdown=False):
-        if dirpath == root:
-            continue
-        if not os.listdir(dirpath):
-            try:
-                os.rmdir(dirpath)
-            except OSError:
-                pass
+    Unlike shutil.copy2, mode bits, flags and xattrs aren't copied; the
+    mtime is all the size + mtime check in _copy_actions relies on.
+    """
+    shutil.copyfile(src, dst)
+    st = os.stat(src)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
 
-def calculate_changes(source_root: str, local_dir: str) -> tuple[int, list[str]]:
-    """Calculates how many files differ between source and local."""
-    remote_files = collect_files(source_root)
+def remove_empty_dirs(root: str):
+    def prune(path: str) -> bool:
+        # Bottom-up: remove the empty directories below path and report
+        # whether path itself ended up empty, so no directory is listed twice
+        try:
+            it = os.scandir(path)
+        except OSError:
+            return False
+        empty = True
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False) and prune(entry.path):
+                    try:
+                        os.rmdir(entry.path)
+                        continue
+                    except OSError:
+                        pass
+                empty = False
+        return empty
+
+    prune(root)
+
+def _copy_actions(source_files: dict[str, str], local_dir: str,
+                  local_files: dict[str, str]) -> list[tuple[str, str, str, str]]:
+    """Return an ('update' | 'create', src, dst, rel_path) action for each
+    file in source_files that is missing or different under local_dir.
+
+    Both dicts are as returned by collect_files.  Files whose size and
+    mtime match (as copy2 leaves them) are taken as identical without
+    reading them.
+    """
+    def check(item):
+        rel_path, src = item
+        dst = os.path.join(local_dir, _to_os(rel_path))
+        # Not found by the walk: no need to stat it
+        if rel_path not in local_files:
+            return ('create', src, dst, rel_path)
+        try:
+            st_dst = os.stat(dst)
+        except OSError:
+            st_dst = None
+        if st_dst is None or not stat.S_ISREG(st_dst.st_mode):
+            return ('create', src, dst, rel_path)
+        try:
+            st_src = os.stat(src)
+        except OSError:
+            st_src = None
+        if st_src and (st_src.st_size, st_src.st_mtime_ns) == (st_dst.st_size, st_dst.st_mtime_ns):
+            return None
+        if not files_identical(src, dst):
+            return ('update', src, dst, rel_path)
+        return None
+
+    with ThreadPoolExecutor(max_workers=COMPARE_WORKERS, thread_name_prefix="compare") as ex:
+        return [action for action in ex.map(check, source_files.items()) if action]
+
+def _delete_actions(local_files: dict[str, str], keep) -> list[tuple[str, None, str, str]]:
+    """Return a ('delete', None, path, rel_path) action for each file in
+    local_files whose relative path isn't in keep."""
+    return [('delete', None, local_files[rel_path], rel_path)
+            for rel_path in local_files.keys() - keep]
+
+def _plan_changes(source_files: dict[str, str], local_dir: str) -> list:
+    """Return every action that makes local_dir match source_files: the
+    creates and updates from _copy_actions, then the deletes.
+
+    local_dir is walked once; each source file costs at most one stat
+    per side before any content is compared.
+    """
     local_files = collect_files(local_dir)
-    changes = 0
-    
-    # Check updates and creates
-    for rel_path in remote_files:
-        src = os.path.join(source_root, rel_path.replace("/", os.sep))
-        dst = os.path.join(local_dir, rel_path.replace("/", os.sep))
-        if os.path.isfile(dst):
-            if not files_identical(src, dst):
-                changes += 1
-        else:
-            changes += 1
-            
+    return _copy_actions(source_files, local_dir, local_files) + _delete_actions(local_files, source_files)
+
+def _apply_changes(changes_to_make: list, copy_file: Callable[[Any, str], None],
+                   progress_cb: Callable[[str, int, int, str], None] | None):
+    """Carry out the actions built by _copy_actions / _zip_copy_actions plus
+    ('delete', None, path, rel_path) entries.
+
+    Files are written by copy_file(src, dst) on a thread pool; deletes run
+    here.  progress_cb is only ever called from the calling thread.
+    """
+    total = len(changes_to_make)
+    idx = 0
+
+    def report(action, rel_path):
+        nonlocal idx
+        idx += 1
+        if progress_cb:
+            progress_cb("syncing", idx, total, f"{'Aktualisiert' if action=='update' else 'Neu erstellt' if action=='create' else 'Gelöscht'} {rel_path}")
+
+    # Create each target directory once up front rather than per file (and
+    # without worker threads racing to create the same one)
+    for parent in sorted({os.path.dirname(dst) for action, _, dst, _ in changes_to_make
+                          if action != 'delete'}):
+        os.makedirs(parent, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=APPLY_WORKERS, thread_name_prefix="apply") as ex:
+        futures = {ex.submit(copy_file, src, dst): (action, rel_path)
+                   for action, src, dst, rel_path in changes_to_make if action != 'delete'}
+        for action, _, dst, rel_path in changes_to_make:
+            if action == 'delete':
+                try:
+                    os.remove(dst)
+                except PermissionError:
+                    pass
+                report(action, rel_path)
+        for fut in as_completed(futures):
+            fut.result()
+            report(*futures[fut])
+
+def _manifest_path(local_dir: str) -> str:
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(local_dir)).encode("utf-8")).hexdigest()
+    return os.path.join(MANIFEST_DIR, key + ".json")
+
+def _load_manifest(local_dir: str) -> dict:
+    """Load the manifest of local_dir.
+
+    "files" maps relative path → [size, mtime_ns, crc] for files last seen
+    identical to a ZIP member with that CRC-32.  "synced" is
+    [repo, branch, sub_dir, commit sha] of the last complete sync, or None.
+    Both are empty if there is no manifest or it can't be read.
+    """
+    manifest = {"files": {}, "synced": None}
+    try:
+        with open(_manifest_path(local_dir), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return manifest
+    if isinstance(data, dict) and isinstance(data.get("files"), dict):
+        manifest["files"] = data["files"]
+        manifest["synced"] = data.get("synced")
+    return manifest
+
+def _save_manifest(local_dir: str, manifest: dict):
+    """Write the manifest of local_dir (atomically, errors are ignored)."""
+    path = _manifest_path(local_dir)
+    try:
+        os.makedirs(MANIFEST_DIR, exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+def _tree_unchanged(local_files: dict[str, str], files: dict) -> bool:
+    """Return True if local_files (from collect_files) are exactly the
+    manifest's files, all with the recorded size and mtime (checked with
+    stat only)."""
+    if local_files.keys() != files.keys():
+        return False
+    for rel_path, path in local_files.items():
+        try:
+            st = os.stat(path)
+            if [st.st_size, st.st_mtime_ns] != files[rel_path][:2]:
+                return False
+        except (OSError, TypeError):
+            return False
+    return True
+
+def _remember(files: dict | None, rel_path: str, dst: str, info: zipfile.ZipInfo):
+    """Record that the file at dst now matches the ZIP member info."""
+    if files is None:
+        return
+    try:
+        st = os.stat(dst)
+    except OSError:
+        files.pop(rel_path, None)
+        return
+    files[rel_path] = [st.st_size, st.st_mtime_ns, info.CRC]
+
+def _zip_copy_actions(readers: _ZipReaders, members: dict[str, zipfile.ZipInfo],
+                      local_dir: str, local_files: dict[str, str],
+                      files: dict | None = None) -> list[tuple[str, zipfile.ZipInfo, str, str]]:
+    """Like _copy_actions, but for ZIP members: return an
+    ('update' | 'create', info, dst, rel_path) action for each member that
+    is missing or different under local_dir.
+
+    With the manifest's files, those whose size and mtime are unchanged
+    since they last matched a member with the same CRC-32 aren't read at
+    all, and files found identical are added to it.
+    """
+    def check(item):
+        rel_path, info = item
+        dst = os.path.join(local_dir, _to_os(rel_path))
+        # Not found by the walk (e.g. a missing target): no need to stat it
+        if rel_path not in local_files:
+            return ('create', info, dst, rel_path)
+        try:
+            st = os.stat(dst)
+        except OSError:
+            st = None
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return ('create', info, dst, rel_path)
+        # The central directory already holds each member's CRC-32, so the
+        # remote side never needs hashing
+        entry = [st.st_size, st.st_mtime_ns, info.CRC]
+        if files is not None and files.get(rel_path) == entry:
+            return None
+        # Otherwise compared byte for byte, not by digest: both sides are
+        # read exactly once either way, and a hash would only add CPU work
+        try:
+            with readers.get().open(info) as fa, open(dst, "rb") as fb:
+                if _streams_identical(fa, fb, info.file_size, st.st_size):
+                    if files is not None:
+                        files[rel_path] = entry
+                    return None
+        except OSError:
+            pass
+        return ('update', info, dst, rel_path)
+
+    with ThreadPoolExecutor(max_workers=COMPARE_WORKERS, thread_name_prefix="compare") as ex:
+        return [action for action in ex.map(check, members.items()) if action]
+
+def calculate_changes_from_zip(zip_data: bytes | str, local_dir: str,
+                               sub_dir: str | None = None) -> tuple[int, list[str]]:
+    """Count the files that differ between the ZIP members below sub_dir and
+    local_dir, comparing the members directly without extracting them."""
+    manifest = _load_manifest(local_dir)
+    files = manifest["files"]
+    known = dict(files)
+    with _ZipReaders(zip_data) as readers:
+        members = _zip_members(readers.get(), sub_dir)
+        local_files = collect_files(local_dir)
+        # Check updates and creates
+        changes = len(_zip_copy_actions(readers, members, local_dir, local_files, files))
+    if files != known:
+        _save_manifest(local_dir, manifest)
+
     # Check deletes
-    local_only = local_files - remote_files
-    changes += len(local_only)
-    return changes, list(remote_files)
+    changes += len(local_files.keys() - members.keys())
+    return changes, list(members)
 
 def sync(repo: str, branch: str, local_dir: str, token: str | None,
          sub_dir: str | None = None,
          download_progress_cb: Callable[[float, bool], None] | None = None,
-         sync_progress_cb: Callable[[str, int, int, str], None] | None = None):
+         sync_progress_cb: Callable[[str, int, int, str], None] | None = None,
+         zip_cache: ZipballCache | None = None):
     
-    if sync_progress_cb:
-        sync_progress_cb("downloading", 0, 1, "Wird heruntergeladen...")
-
-    zip_bytes = download_zipball(repo, branch, token, download_progress_cb)
+    # Walk local_dir in the background while the commit is looked up and
+    # the archive downloads
+    scanner = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scan")
+    local_scan = scanner.submit(collect_files, local_dir)
+    scanner.shutdown(wait=False)
+
+    # Same commit as the last complete sync and nothing touched locally
+    # since: done without downloading anything
+    manifest = _load_manifest(local_dir)
+    try:
+        sha = get_latest_commit_sha(repo, branch, token)
+    except SyncError:
+        sha = None  # the download below reports the actual problem
+    synced = [repo, branch, sub_dir or "", sha] if sha else None
+    if (synced and manifest["synced"] == synced
+            and _tree_unchanged(local_scan.result(), manifest["files"])):
+        if sync_progress_cb:
+            sync_progress_cb("done", 1, 1, "Keine Änderungen (bereits aktuell)")
+        return
 
     if sync_progress_cb:
-        sync_progress_cb("extracting", 0, 1, "Wird entpackt...")
+        sync_progress_cb("downloading", 0, 1, "Wird heruntergeladen...")
 
-    source_root = extract_zip_to_temp(zip_bytes, sub_dir)
+    own_zip = zip_cache is None
+    if own_zip:
+        zip_data = _download_spooled(repo, branch, token, download_progress_cb)
+    else:
+        zip_data = zip_cache.get(repo, branch, token, download_progress_cb)
 
     try:
-        remote_files = collect_files(source_root)
-        local_files = collect_files(local_dir)
-        
-        # Calculate changes first so progress bar maps perfectly to actions
-        changes_to_make = []
-        for rel_path in remote_files:
-            src = os.path.join(source_root, rel_path.replace("/", os.sep))
-            dst = os.path.join(local_dir, rel_path.replace("/", os.sep))
-            if os.path.isfile(dst):
-                if not files_identical(src, dst):
-                    changes_to_make.append(('update', src, dst, rel_path))
-            else:
-                 changes_to_make.append(('create', src, dst, rel_path))
-
-        local_only = local_files - remote_files
-        for rel_path in local_only:
-             abs_path = os.path.join(local_dir, rel_path.replace("/", os.sep))
-             changes_to_make.append(('delete', None, abs_path, rel_path))
-
-        total = len(changes_to_make)
-        if total == 0:
-            if sync_progress_cb:
-                sync_progress_cb("done", 1, 1, "Keine Änderungen (bereits aktuell)")
-            return
-
-        for idx, (action, src, dst, rel_path) in enumerate(changes_to_make, 1):
-             if action == 'update' or action == 'create':
-                 os.makedirs(os.path.dirname(dst), exist_ok=True)
-                 shutil.copy2(src, dst)
-             elif action == 'delete':
-                 try:
-                     os.remove(dst)
-                 except PermissionError:
-                     pass
-             if sync_progress_cb:
-                 sync_progress_cb("syncing", idx, total, f"{'Aktualisiert' if action=='update' else 'Neu erstellt' if action=='create' else 'Gelöscht'} {rel_path}")
-
+        if sync_progress_cb:
+            sync_progress_cb("extracting", 0, 1, "Wird entpackt...")
+
+        # The branch may have moved on since sha was looked up
+        if synced and not zipball_revision(zip_data).endswith("-" + sha[:7]):
+            synced = None
+
+        # Members are compared and written straight from the archive; nothing
+        # is extracted to a temp directory first
+        with _ZipReaders(zip_data) as readers:
+            members = _zip_members(readers.get(), sub_dir)
+            local_files = local_scan.result()
+            # Drop entries of files that are no longer part of the branch
+            files = {rel: entry for rel, entry in manifest["files"].items() if rel in members}
+            manifest = {"files": files, "synced": synced}
+
+            # Calculate changes first so progress bar maps perfectly to actions
+            changes_to_make = (_zip_copy_actions(readers, members, local_dir, local_files, files)
+                               + _delete_actions(local_files, members))
+
+            total = len(changes_to_make)
+            if total == 0:
+                _save_manifest(local_dir, manifest)
+                if sync_progress_cb:
+                    sync_progress_cb("done", 1, 1, "Keine Änderungen (bereits aktuell)")
+                return
+
+            def write_member(info, dst):
+                with readers.get().open(info) as src, open(dst, "wb") as out:
+                    shutil.copyfileobj(src, out, DOWNLOAD_CHUNK_SIZE)
+
+            _apply_changes(changes_to_make, write_member, sync_progress_cb)
+            for action, info, dst, rel_path in changes_to_make:
+                if action != 'delete':
+                    _remember(files, rel_path, dst, info)
+
+        _save_manifest(local_dir, manifest)
         remove_empty_dirs(local_dir)
 
         if sync_progress_cb:
             sync_progress_cb("done", total, total, "Synchronisierung abgeschlossen")
-            
+
     finally:
-        tmp_root = source_root
-        tmp_base = tempfile.gettempdir()
-        while os.path.dirname(tmp_root) != tmp_base and tmp_root != tmp_base:
-            tmp_root = os.path.dirname(tmp_root)
-        shutil.rmtree(tmp_root, ignore_errors=True)
+        if not own_zip:
+            zip_cache.release(zip_data)
+        elif isinstance(zip_data, str):
+            os.remove(zip_data)
 
 
 def local_mirror(source_dir: str, target_dir: str,
@@ -253,23 +954,7 @@ def local_mirror(source_dir: str, target_dir: str,
 
     os.makedirs(target_dir, exist_ok=True)
 
-    src_files = collect_files(source_dir)
-    tgt_files = collect_files(target_dir)
-
-    changes_to_make = []
-    for rel_path in src_files:
-        src = os.path.join(source_dir, rel_path.replace("/", os.sep))
-        dst = os.path.join(target_dir, rel_path.replace("/", os.sep))
-        if os.path.isfile(dst):
-            if not files_identical(src, dst):
-                changes_to_make.append(('update', src, dst, rel_path))
-        else:
-            changes_to_make.append(('create', src, dst, rel_path))
-
-    tgt_only = tgt_files - src_files
-    for rel_path in tgt_only:
-        abs_path = os.path.join(target_dir, rel_path.replace("/", os.sep))
-        changes_to_make.append(('delete', None, abs_path, rel_path))
+    changes_to_make = _plan_changes(collect_files(source_dir), target_dir)
 
     total = len(changes_to_make)
     if total == 0:
@@ -277,18 +962,7 @@ def local_mirror(source_dir: str, target_dir: str,
             progress_cb("done", 1, 1, "Keine Änderungen (bereits aktuell)")
         return
 
-    for idx, (action, src, dst, rel_path) in enumerate(changes_to_make, 1):
-        if action in ('update', 'create'):
-            os.makedirs(os.path.dirname(dst), exist_ok=True)
-            shutil.copy2(src, dst)
-        elif action == 'delete':
-            try:
-                os.remove(dst)
-            except PermissionError:
-                pass
-        if progress_cb:
-            progress_cb("syncing", idx, total,
-                        f"{'Aktualisiert' if action=='update' else 'Neu erstellt' if action=='create' else 'Gelöscht'} {rel_path}")
+    _apply_changes(changes_to_make, _copy_file, progress_cb)
 
     remove_empty_dirs(target_dir)
 